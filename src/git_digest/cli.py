@@ -1,20 +1,29 @@
+import asyncio
 import logging
+import sys
 from pathlib import Path
 
 import typer
 
 from git_digest.types import Provider
 from git_digest.utils.git import (
+    GIT_LOG_TIMEOUT,
+    MAX_MESSAGE_LENGTH,
+    CommitReadOptions,
     GitCommit,
     aggregate_commits_from_repos,
+    check_git_version,
+    compile_path_excludes,
     filter_commits_by_authors,
     group_commits_by_author,
     validate_repositories,
 )
 from git_digest.utils.llm import (
-    format_commits_for_llm,
+    MAX_CONCURRENT_REQUESTS,
+    get_llm_client,
     summarize,
     summarize_by_author,
+    validate_provider_credentials,
 )
 
 logger = logging.getLogger(__name__)
@@ -32,16 +41,25 @@ def setup_logging(debug: bool = False) -> None:
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
+    # Per-request HTTP logs would otherwise be interleaved with streamed output.
+    if not debug:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def parse_comma_separated(values: list[str]) -> list[str]:
+    """Parse comma-separated option values and flatten the list."""
+    # Split each argument by comma, strip whitespace and drop empty entries
+    return [
+        value
+        for value_arg in values
+        for value in (v.strip() for v in value_arg.split(","))
+        if value
+    ]
 
 
 def parse_author_filters(authors: list[str]) -> list[str]:
     """Parse comma-separated author names and flatten the list."""
-    parsed_authors: list[str] = []
-    for author_arg in authors:
-        # Split by comma and strip whitespace
-        split_authors = [a.strip() for a in author_arg.split(",") if a.strip()]
-        parsed_authors.extend(split_authors)
-    return parsed_authors
+    return parse_comma_separated(authors)
 
 
 def apply_author_filtering(
@@ -77,47 +95,75 @@ def apply_author_filtering(
     return filtered_commits
 
 
+def write_output(text: str) -> None:
+    """Write summary text to stdout in one call and flush it immediately."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
 def generate_and_display_summary(
     commits: list[GitCommit],
     by_author: bool,
     provider: Provider,
     repo_names: list[str],
     parsed_authors: list[str],
+    use_cache: bool = True,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
 ) -> None:
     """Generate and display the summary based on the mode."""
+    # One client (and so one HTTP connection pool) serves every LLM request.
+    client, model = get_llm_client(provider)
+
     if by_author:
         logger.debug("Grouping commits by author")
         author_commits = group_commits_by_author(commits)
         logger.info(f"Found {len(author_commits)} unique authors")
 
-        logger.debug("Generating author-specific summaries")
-        summary = summarize_by_author(author_commits, provider)
-
-        print("\n" + "=" * 60)
         header = "GIT DIGEST SUMMARY - BY AUTHOR"
         if parsed_authors:
             header += " (FILTERED)"
-        print(header)
-        print("=" * 60)
-        print(summary)
-        print("=" * 60)
-    else:
-        logger.debug("Formatting commits for LLM processing")
-        commits_text = format_commits_for_llm(commits)
-        logger.debug("Calling LLM for summary generation")
-        summary = summarize(commits_text, provider, repo_names)
+        rule = "=" * 60
+        write_output(f"\n{rule}\n{header}\n{rule}\n")
 
-        print("\n" + "=" * 50)
+        # Author sections are written, in order, as soon as they are ready.
+        logger.debug("Generating author-specific summaries")
+        asyncio.run(
+            summarize_by_author(
+                client,
+                model,
+                author_commits,
+                provider,
+                use_cache,
+                max_concurrency,
+                on_text=write_output,
+            )
+        )
+        write_output(f"\n{rule}\n")
+    else:
         if len(repo_names) > 1:
             header = f"GIT DIGEST SUMMARY - {len(repo_names)} REPOSITORIES"
         else:
             header = "GIT DIGEST SUMMARY"
         if parsed_authors:
             header += " (FILTERED)"
-        print(header)
-        print("=" * 50)
-        print(summary)
-        print("=" * 50)
+        rule = "=" * 50
+        write_output(f"\n{rule}\n{header}\n{rule}\n")
+
+        # The summary is streamed to the terminal as the LLM generates it.
+        logger.debug("Calling LLM for summary generation")
+        asyncio.run(
+            summarize(
+                client,
+                model,
+                commits,
+                provider,
+                repo_names,
+                use_cache,
+                on_text=write_output,
+                max_concurrency=max_concurrency,
+            )
+        )
+        write_output(f"\n{rule}\n")
 
 
 @app.command()
@@ -142,7 +188,7 @@ def digest(
         None,
         "--count",
         "-c",
-        help="Get the last N commits (overrides since/until/days)",
+        help="Get the last N commits across all repositories (overrides since/until/days)",
     ),
     debug: bool = typer.Option(
         False,
@@ -164,6 +210,33 @@ def digest(
         "--authors",
         help="Filter commits by author names (partial matching, case-insensitive). Supports comma-separated values: --authors 'Alice,Bob' or multiple flags: --authors Alice --authors Bob",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always call the LLM and read every commit from git instead of reusing cached results",
+    ),
+    exclude: list[str] = typer.Option(
+        [],
+        "--exclude",
+        help="Leave changed files matching these glob patterns out of the summary (e.g. 'vendor/*,*.lock'). Supports comma-separated values or multiple flags",
+    ),
+    full_messages: bool = typer.Option(
+        False,
+        "--full-messages",
+        help=f"Send commit messages verbatim instead of collapsing whitespace and truncating them to {MAX_MESSAGE_LENGTH} characters",
+    ),
+    git_timeout: float = typer.Option(
+        GIT_LOG_TIMEOUT,
+        "--git-timeout",
+        min=0,
+        help="Seconds a repository's git log may run before it is skipped (0 for no limit)",
+    ),
+    concurrency: int = typer.Option(
+        MAX_CONCURRENT_REQUESTS,
+        "--concurrency",
+        min=1,
+        help="Maximum number of LLM requests sent at once",
+    ),
 ):
     """
     Generate a human-readable summary of recent git commits.
@@ -176,12 +249,21 @@ def digest(
         logger.error("Please specify at least one repository.")
         raise typer.Exit(1)
 
+    # Check the API key up front rather than after all the git work is done.
+    validate_provider_credentials(provider)
+
     parsed_authors = parse_author_filters(authors)
+    exclude_patterns = parse_comma_separated(exclude)
 
     logger.debug(
-        f"Command arguments: repo_paths={repo_paths}, since={since}, until={until}, days={days}, count={count}, by_author={by_author}, provider={provider}, authors={parsed_authors}"
+        f"Command arguments: repo_paths={repo_paths}, since={since}, until={until}, days={days}, count={count}, by_author={by_author}, provider={provider}, authors={parsed_authors}, exclude={exclude_patterns}, full_messages={full_messages}, no_cache={no_cache}, git_timeout={git_timeout}, concurrency={concurrency}"
     )
 
+    git_error = check_git_version()
+    if git_error:
+        logger.error(git_error)
+        raise typer.Exit(1)
+
     # Validate repositories
     valid_repos, error_messages = validate_repositories(repo_paths)
 
@@ -204,7 +286,20 @@ def digest(
     try:
         # Aggregate commits from all repositories
         logger.debug("Aggregating commits from repositories")
-        commits = aggregate_commits_from_repos(valid_repos, since, until, days, count)
+        commits = aggregate_commits_from_repos(
+            valid_repos,
+            since,
+            until,
+            days,
+            count,
+            repo_names=repo_names,
+            options=CommitReadOptions(
+                use_cache=not no_cache,
+                exclude=compile_path_excludes(exclude_patterns),
+                max_message_length=None if full_messages else MAX_MESSAGE_LENGTH,
+                timeout=git_timeout or None,
+            ),
+        )
 
         if not commits:
             if count is not None:
@@ -236,7 +331,13 @@ def digest(
         )
 
         generate_and_display_summary(
-            commits, by_author, provider, repo_names, parsed_authors
+            commits,
+            by_author,
+            provider,
+            repo_names,
+            parsed_authors,
+            not no_cache,
+            concurrency,
         )
 
     except Exception as e:
@@ -1,19 +1,22 @@
-from git_digest.types import Provider
+from git_digest.types import Provider, ProviderConfig
 
-PROVIDERS = {
+PROVIDERS: dict[Provider, ProviderConfig] = {
     Provider.OPENAI: {
         "base_url": "https://api.openai.com/v1",
         "api_key_env": "OPENAI_API_KEY",
         "default_model": "gpt-5",
+        "context_window": 272_000,
     },
     Provider.COHERE: {
         "base_url": "https://api.cohere.ai/compatibility/v1",
         "api_key_env": "COHERE_API_KEY",
         "default_model": "command-a-03-2025",
+        "context_window": 256_000,
     },
     Provider.ANTHROPIC: {
         "base_url": "https://api.anthropic.com/v1/",
         "api_key_env": "ANTHROPIC_API_KEY",
         "default_model": "claude-opus-4-1-20250805",
+        "context_window": 200_000,
     },
 }
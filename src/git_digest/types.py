@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import TypedDict
 
 
 class Provider(str, Enum):
@@ -7,3 +8,12 @@ class Provider(str, Enum):
     OPENAI = "openai"
     COHERE = "cohere"
     ANTHROPIC = "anthropic"
+
+
+class ProviderConfig(TypedDict):
+    """Connection details and model limits for an LLM provider."""
+
+    base_url: str
+    api_key_env: str
+    default_model: str
+    context_window: int  # Context window of default_model, in tokens
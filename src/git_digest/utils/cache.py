@@ -0,0 +1,114 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from functools import cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Follows the XDG base directory spec, defaulting to ~/.cache/git-digest.
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "git-digest"
+
+# Cached entries expire after 7 days by default.
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+# Maximum number of keys looked up by a single query in get_many.
+_MAX_QUERY_KEYS = 500
+
+
+def make_cache_key(**parts: str) -> str:
+    """Build a stable SHA-256 cache key from the given named parts."""
+    payload = json.dumps(parts, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Persistent key/value cache with per-entry expiry, backed by SQLite.
+
+    A cache can be shared between threads; its operations are serialized.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            # Expired entries are never read again, so they are dropped once per
+            # run to keep the file from growing without bound.
+            with connection:
+                connection.execute(
+                    "DELETE FROM cache WHERE expires_at <= ?", (time.time(),)
+                )
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None if missing or expired."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Return the cached values of the given keys that are present and fresh."""
+        keys = list(keys)
+        values: dict[str, str] = {}
+        try:
+            with self._lock:
+                connection = self._connect()
+                now = time.time()
+                for start in range(0, len(keys), _MAX_QUERY_KEYS):
+                    batch = keys[start : start + _MAX_QUERY_KEYS]
+                    placeholders = ", ".join("?" * len(batch))
+                    values.update(
+                        connection.execute(
+                            "SELECT key, value FROM cache "
+                            f"WHERE key IN ({placeholders}) AND expires_at > ?",
+                            (*batch, now),
+                        ).fetchall()
+                    )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Cache lookup failed: {str(e)}")
+            return {}
+        return values
+
+    def set(self, key: str, value: str, ttl: float = DEFAULT_TTL) -> None:
+        """Store value under key for ttl seconds."""
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, items: Mapping[str, str], ttl: float = DEFAULT_TTL) -> None:
+        """Store several key/value pairs for ttl seconds, in one transaction."""
+        expires_at = time.time() + ttl
+        try:
+            with self._lock, self._connect() as connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    [(key, value, expires_at) for key, value in items.items()],
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Cache write failed: {str(e)}")
+
+
+@cache
+def get_llm_cache() -> ResponseCache:
+    """Return the shared cache for LLM responses."""
+    return ResponseCache(CACHE_DIR / "llm.sqlite3")
+
+
+@cache
+def get_commit_cache() -> ResponseCache:
+    """Return the shared cache for parsed git commits."""
+    return ResponseCache(CACHE_DIR / "commits.sqlite3")
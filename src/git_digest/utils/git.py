@@ -1,26 +1,73 @@
+import fnmatch
+import heapq
+import json
 import logging
-from collections import defaultdict
-from dataclasses import dataclass
-from datetime import datetime
+import os
+import re
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
 
-from git import Repo
+from git_digest.utils.cache import get_commit_cache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _author_identity(author: str, email: str) -> tuple[str, str]:
+    """
+    Return the "Author <email>" key and its lowercase form.
+
+    Authors repeat heavily across commits, so the strings are built once per
+    unique author and shared by all of their commits.
+    """
+    author_key = f"{author} <{email}>"
+    return author_key, author_key.lower()
+
+
+@dataclass(slots=True)
 class GitCommit:
     """Git commit data container."""
 
     hash: str
     author: str
     email: str
-    date: datetime
+    committed_at: int  # Committer timestamp, in seconds since the epoch
+    date_str: str  # Committer date in local time, formatted as COMMIT_DATE_FORMAT
     message: str
     files_changed: list[str]
     repo_name: str = ""
+    # "Author <email>" identity used for grouping, filtering and display, plus
+    # its lowercase form for case-insensitive matching. Shared per unique author.
+    author_key: str = field(init=False, repr=False, compare=False)
+    author_key_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.author_key, self.author_key_lower = _author_identity(
+            self.author, self.email
+        )
+
+
+def _validate_repository(repo_path: str) -> str | None:
+    """Return an error message if repo_path is not a git repository, else None."""
+    # A single stat of `.git` covers the common case; it also accepts the `.git`
+    # file used by worktrees and submodules. The parent directory is only checked
+    # when we need to tell the two errors apart.
+    try:
+        os.stat(os.path.join(repo_path, ".git"))
+    except (FileNotFoundError, NotADirectoryError):
+        if not os.path.exists(repo_path):
+            return f"Repository path '{repo_path}' does not exist"
+        return f"'{repo_path}' is not a git repository"
+    return None
 
 
 def validate_repositories(repo_paths: list[str]) -> tuple[list[str], list[str]]:
@@ -28,152 +75,488 @@ def validate_repositories(repo_paths: list[str]) -> tuple[list[str], list[str]]:
     valid_paths: list[str] = []
     error_messages: list[str] = []
 
-    for repo_path in repo_paths:
-        repo_path_obj = Path(repo_path)
-        if not repo_path_obj.exists():
-            error_messages.append(f"Repository path '{repo_path}' does not exist")
-        elif not (repo_path_obj / ".git").exists():
-            error_messages.append(f"'{repo_path}' is not a git repository")
-        else:
+    if not repo_paths:
+        return valid_paths, error_messages
+
+    # stat() releases the GIL, so checks on slow (e.g. network) filesystems
+    # overlap across threads. map() keeps the results in input order.
+    with ThreadPoolExecutor(max_workers=min(32, len(repo_paths))) as executor:
+        errors = list(executor.map(_validate_repository, repo_paths))
+
+    for repo_path, error in zip(repo_paths, errors):
+        if error is None:
             valid_paths.append(repo_path)
+        else:
+            error_messages.append(error)
 
     return valid_paths, error_messages
 
 
+# `--diff-merges=first-parent`, used when reading commits, was added in git 2.31.
+MIN_GIT_VERSION = (2, 31)
+
+
+def check_git_version() -> str | None:
+    """Return an error message if git is missing or older than MIN_GIT_VERSION."""
+    try:
+        result = subprocess.run(
+            ["git", "--version"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "git is not installed or could not be run"
+
+    version = result.stdout.strip()
+    match = re.search(r"(\d+)\.(\d+)", version)
+    if match and (int(match[1]), int(match[2])) < MIN_GIT_VERSION:
+        required = ".".join(map(str, MIN_GIT_VERSION))
+        return f"git {required} or newer is required (found {version})"
+    return None
+
+
+# Pretty format for the single `git log` call that feeds every commit retrieval.
+# Every field is NUL-terminated, as NUL cannot occur in names, emails, messages or
+# (with -z) paths. Each record starts with a "/" token, which is never a path since
+# git paths are relative, followed by the header fields and then the NUL-separated
+# `--name-only` file list.
+_LOG_FORMAT = "--pretty=format:/%x00%H%x00%an%x00%ae%x00%ct%x00%cd%x00%B%x00"
+_RECORD_MARKER = b"/"
+
+# Tokens at the start of each record: the marker and the six header fields.
+_HEADER_TOKENS = 7
+
+# Format of commit dates shown to users and the LLM. git renders it (for `%cd`)
+# while logging, so no datetime is built per commit.
+COMMIT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Size of the chunks read from the `git log` pipe.
+_READ_SIZE = 64 * 1024
+
+# Default number of seconds a single repository's `git log` may run before it is
+# killed, so one hung repository cannot stall a digest. Generous enough for large
+# histories; the CLI's --git-timeout changes or disables it.
+GIT_LOG_TIMEOUT = 300.0
+
+# Parsed commits never change for a given hash, so they are kept for 30 days.
+COMMIT_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Changed files kept per commit; the rest are replaced by a "... and N more
+# files" entry, so huge merges or vendoring commits do not flood the prompt.
+MAX_FILES_PER_COMMIT = 50
+
+
+# Default length to which commit messages are cut (after collapsing whitespace)
+# when they are not kept verbatim, so huge squash-merge or generated messages do
+# not dominate the prompt.
+MAX_MESSAGE_LENGTH = 500
+
+
+@dataclass(frozen=True, slots=True)
+class CommitReadOptions:
+    """How commits are read from git, shared by every repository of a digest."""
+
+    # Reuse commits parsed by earlier runs (from the commit cache), and only read
+    # the changed files of new commits from git
+    use_cache: bool = False
+    # Changed files to leave out (see `compile_path_excludes`)
+    exclude: re.Pattern[str] | None = None
+    # If set, collapse whitespace in commit messages and cut them to this length
+    max_message_length: int | None = None
+    # Seconds after which a repository's `git log` is killed (None for no limit)
+    timeout: float | None = GIT_LOG_TIMEOUT
+
+
+def compile_path_excludes(patterns: list[str]) -> re.Pattern[str] | None:
+    """
+    Compile glob patterns (e.g. "vendor/*", "*.lock") into one path matcher.
+
+    Patterns are matched against the full path, and `*` also matches `/`.
+
+    Returns:
+        The compiled pattern, or None if no patterns are given
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def _select_files(paths: Iterable[str], exclude: re.Pattern[str] | None) -> list[str]:
+    """Sort and de-duplicate paths, dropping excluded ones and capping the count."""
+    files = sorted(
+        {path for path in paths if path and not (exclude and exclude.match(path))}
+    )
+    if len(files) > MAX_FILES_PER_COMMIT:
+        hidden = len(files) - MAX_FILES_PER_COMMIT
+        files[MAX_FILES_PER_COMMIT:] = [f"... and {hidden} more files"]
+    return files
+
+
+def _shorten_message(message: str, max_length: int) -> str:
+    """Collapse whitespace in message and cut it to max_length characters."""
+    message = " ".join(message.split())
+    if len(message) > max_length:
+        message = message[:max_length] + "... [truncated]"
+    return message
+
+
+def _parse_log_record(
+    record: list[bytes],
+    repo_name: str,
+    exclude: re.Pattern[str] | None = None,
+    max_message_length: int | None = None,
+) -> GitCommit:
+    """
+    Build a GitCommit from the NUL-separated tokens of one `_LOG_FORMAT` record.
+
+    Raises:
+        ValueError: If the record is malformed
+    """
+    _, hexsha, author, email, timestamp, date_str, message, *files = (
+        token.decode("utf-8", errors="replace") for token in record
+    )
+    # git separates the header from the file list with a newline.
+    if files:
+        files[0] = files[0].removeprefix("\n")
+    message = message.strip()
+    if max_message_length is not None:
+        message = _shorten_message(message, max_message_length)
+    return GitCommit(
+        hash=hexsha,
+        author=author or "Unknown",
+        email=email or "unknown@example.com",
+        committed_at=int(timestamp),
+        date_str=date_str,
+        message=message,
+        files_changed=_select_files(files, exclude),
+        repo_name=repo_name,
+    )
+
+
+def _parse_log_stream(
+    chunks: Iterable[bytes],
+    repo_name: str,
+    exclude: re.Pattern[str] | None = None,
+    max_message_length: int | None = None,
+) -> Iterator[GitCommit]:
+    """
+    Parse `git log` output in `_LOG_FORMAT`, read in chunks, into commits.
+
+    A malformed record is logged and skipped rather than failing the whole log.
+    """
+
+    def parse(record: list[bytes]) -> GitCommit | None:
+        try:
+            return _parse_log_record(record, repo_name, exclude, max_message_length)
+        except ValueError as e:
+            logger.warning(f"Skipping unreadable commit in {repo_name}: {str(e)}")
+            return None
+
+    # Header fields are taken by position, so only a marker that follows them
+    # (where the file list is) starts the next record.
+    record: list[bytes] = []
+    pending = b""
+    for chunk in chunks:
+        *tokens, pending = (pending + chunk).split(b"\0")
+        for token in tokens:
+            if token == _RECORD_MARKER and len(record) >= _HEADER_TOKENS:
+                if commit := parse(record):
+                    yield commit
+                record = [token]
+            else:
+                record.append(token)
+    if pending:
+        record.append(pending)
+    if record and (commit := parse(record)):
+        yield commit
+
+
+def _stream_log(
+    repo_path: str,
+    log_args: list[str],
+    repo_name: str,
+    options: CommitReadOptions,
+    stdin: bytes | None = None,
+) -> Iterator[GitCommit]:
+    """
+    Run `git log` with `_LOG_FORMAT` and the given arguments, yielding commits.
+
+    The output is parsed as it arrives, as set out by options. If given, stdin
+    (e.g. revisions for `--stdin`) is written to git before its output is read.
+    """
+    timeout = options.timeout
+    # Merge commits are compared with their first parent, renames are listed as
+    # both the old and the new path, and the root commit lists every file it adds
+    # (regardless of the user's log.showRoot setting).
+    command = [
+        "git",
+        "-C",
+        repo_path,
+        "log",
+        _LOG_FORMAT,
+        f"--date=format-local:{COMMIT_DATE_FORMAT}",
+        "--name-only",
+        "-z",
+        "--root",
+        "--no-renames",
+        "--diff-merges=first-parent",
+        *log_args,
+    ]
+
+    # stderr goes to a file rather than a pipe: git could otherwise block writing
+    # a long error while we wait for stdout, and never finish.
+    with (
+        tempfile.TemporaryFile() as stderr_file,
+        subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE if stdin is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+        ) as process,
+    ):
+        assert process.stdout is not None
+
+        timed_out = threading.Event()
+
+        def kill_process() -> None:
+            timed_out.set()
+            process.kill()
+
+        watchdog = threading.Timer(timeout, kill_process) if timeout else None
+        if watchdog:
+            watchdog.daemon = True
+            watchdog.start()
+
+        try:
+            if stdin is not None:
+                assert process.stdin is not None
+                try:
+                    process.stdin.write(stdin)
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass  # git exited early; its error is reported below
+            yield from _parse_log_stream(
+                iter(partial(process.stdout.read, _READ_SIZE), b""),
+                repo_name,
+                options.exclude,
+                options.max_message_length,
+            )
+        finally:
+            if watchdog:
+                watchdog.cancel()
+
+        if timed_out.is_set():
+            raise TimeoutError(f"git log did not finish within {timeout} seconds")
+
+        if process.wait() != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+            raise RuntimeError(f"git log failed: {stderr.strip()}")
+
+
+def _list_commit_hashes(
+    repo_path: str, log_args: list[str], timeout: float | None
+) -> list[str]:
+    """Return the hashes of the commits `git log` selects, newest first."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", repo_path, "log", "--format=%H", *log_args],
+            capture_output=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        raise TimeoutError(f"git log did not finish within {timeout} seconds")
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"git log failed: {stderr.strip()}")
+    return result.stdout.decode().split()
+
+
+# Serializes cached commits without the default separators' padding.
+_encode_cached_commit = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _commit_cache_key(hexsha: str, options: CommitReadOptions) -> str:
+    # The rendered date depends on the local time zone, and the stored message
+    # and file list on the shortening, exclusions and cap applied while parsing.
+    return make_cache_key(
+        hash=hexsha,
+        format=_LOG_FORMAT,
+        date_format=COMMIT_DATE_FORMAT,
+        tz=str(time.tzname),
+        exclude=options.exclude.pattern if options.exclude else "",
+        max_files=str(MAX_FILES_PER_COMMIT),
+        max_message_length=str(options.max_message_length),
+    )
+
+
+def _get_cached_commits(
+    repo_path: str, log_args: list[str], repo_name: str, options: CommitReadOptions
+) -> Iterator[GitCommit]:
+    """
+    Like `_stream_log`, but reuse commits parsed by earlier runs.
+
+    A commit's metadata and changed files never change for a given hash, so only
+    the (cheap) list of selected hashes is computed on every run; the (costly)
+    file lists are read from git only for commits missing from the cache.
+    """
+    hashes = _list_commit_hashes(repo_path, log_args, options.timeout)
+    cache = get_commit_cache()
+    keys = {hexsha: _commit_cache_key(hexsha, options) for hexsha in hashes}
+    cached = cache.get_many(keys.values())
+
+    # Each entry is a compact JSON array; all hits are decoded with a single
+    # json.loads call over one joined array rather than one call per commit.
+    hits = [hexsha for hexsha in hashes if keys[hexsha] in cached]
+    rows = json.loads("[" + ",".join(cached[keys[hexsha]] for hexsha in hits) + "]")
+    commits: dict[str, GitCommit] = {
+        hexsha: GitCommit(
+            hash=hexsha,
+            author=author,
+            email=email,
+            committed_at=committed_at,
+            date_str=date_str,
+            message=message,
+            files_changed=files,
+            repo_name=repo_name,
+        )
+        for hexsha, (author, email, committed_at, date_str, message, files) in zip(
+            hits, rows
+        )
+    }
+
+    missing = [hexsha for hexsha in hashes if hexsha not in commits]
+    logger.debug(
+        f"{len(hashes) - len(missing)} of {len(hashes)} commits from {repo_name} "
+        "found in the commit cache"
+    )
+    if missing:
+        fetched = list(
+            _stream_log(
+                repo_path,
+                ["--no-walk=unsorted", "--stdin"],
+                repo_name,
+                options,
+                stdin="\n".join(missing).encode(),
+            )
+        )
+        cache.set_many(
+            {
+                keys[commit.hash]: _encode_cached_commit(
+                    [
+                        commit.author,
+                        commit.email,
+                        commit.committed_at,
+                        commit.date_str,
+                        commit.message,
+                        commit.files_changed,
+                    ]
+                )
+                for commit in fetched
+            },
+            COMMIT_CACHE_TTL,
+        )
+        commits.update((commit.hash, commit) for commit in fetched)
+
+    # Commits that could not be parsed were skipped by `_stream_log`.
+    for hexsha in hashes:
+        if hexsha in commits:
+            yield commits[hexsha]
+
+
 def get_commits(
-    repo_path: str, since: str | None = None, until: str | None = None
-) -> list[GitCommit]:
+    repo_path: str,
+    since: str | None = None,
+    until: str | None = None,
+    max_count: int | None = None,
+    repo_name: str | None = None,
+    options: CommitReadOptions = CommitReadOptions(),
+) -> Iterator[GitCommit]:
     """
-    Retrieve git commits within a date range.
+    Retrieve git commits and their changed files with a single `git log` call.
+
+    The output of `git log` is streamed and parsed as it arrives, so commits are
+    yielded before git has finished walking the history.
 
     Args:
         repo_path: Path to the git repository
         since: Start date (e.g., "2024-01-01", "1 week ago", "yesterday")
         until: End date (e.g., "2024-01-31", "today")
+        max_count: Maximum number of commits to return (newest first)
+        repo_name: Name recorded on each commit (defaults to the directory name)
+        options: How commits are read (caching, exclusions, message length and
+            timeout)
 
-    Returns:
-        List of GitCommit objects
+    Yields:
+        GitCommit objects, newest first
+
+    Raises:
+        RuntimeError: If `git log` fails (e.g., the repository has no commits)
+        TimeoutError: If `git log` does not finish within the timeout
     """
-    repo = Repo(repo_path)
-    repo_name = Path(repo_path).name
+    if repo_name is None:
+        repo_name = Path(repo_path).name
 
-    kwargs: dict[str, Any] = {}
+    log_args: list[str] = []
     if since:
-        kwargs["since"] = since
+        log_args.append(f"--since={since}")
     if until:
-        kwargs["until"] = until
-
-    commits: list[GitCommit] = []
-    for commit in repo.iter_commits(**kwargs):
-        # Get list of files changed in this commit
-        files_changed: list[str] = []
-        if commit.parents:
-            # Compare with first parent to get changed files
-            for diff in commit.diff(commit.parents[0]):
-                if diff.a_path:
-                    files_changed.append(diff.a_path)
-                if diff.b_path and diff.b_path != diff.a_path:
-                    files_changed.append(diff.b_path)
-        else:
-            # Initial commit - all files are "changed"
-            for item in commit.tree.traverse():
-                if (
-                    hasattr(item, "type") and getattr(item, "type", None) == "blob"
-                ):  # It's a file
-                    item_path = getattr(item, "path", "")
-                    if item_path:
-                        files_changed.append(str(item_path))
-
-        commits.append(
-            GitCommit(
-                hash=commit.hexsha,
-                author=commit.author.name or "Unknown",
-                email=commit.author.email or "unknown@example.com",
-                date=datetime.fromtimestamp(commit.committed_date),
-                message=commit.message.strip()
-                if isinstance(commit.message, str)
-                else commit.message.decode().strip(),
-                files_changed=files_changed,
-                repo_name=repo_name,
-            )
-        )
+        log_args.append(f"--until={until}")
+    if max_count is not None:
+        log_args.append(f"--max-count={max_count}")
 
-    return commits
+    if options.use_cache:
+        return _get_cached_commits(repo_path, log_args, repo_name, options)
+    return _stream_log(repo_path, log_args, repo_name, options)
 
 
-def get_recent_commits(repo_path: str, days: int = 7) -> list[GitCommit]:
+def get_recent_commits(
+    repo_path: str,
+    days: int = 7,
+    repo_name: str | None = None,
+    options: CommitReadOptions = CommitReadOptions(),
+) -> Iterator[GitCommit]:
     """Get commits from the last N days."""
-    return get_commits(repo_path, since=f"{days} days ago")
-
-
-def get_recent_commits_by_count(repo_path: str, count: int) -> list[GitCommit]:
-    """Get the last N commits regardless of date."""
-    repo = Repo(repo_path)
-    repo_name = Path(repo_path).name
-
-    commits: list[GitCommit] = []
-    for commit in repo.iter_commits(max_count=count):
-        # Get list of files changed in this commit
-        files_changed: list[str] = []
-        if commit.parents:
-            # Compare with first parent to get changed files
-            for diff in commit.diff(commit.parents[0]):
-                if diff.a_path:
-                    files_changed.append(diff.a_path)
-                if diff.b_path and diff.b_path != diff.a_path:
-                    files_changed.append(diff.b_path)
-        else:
-            # Initial commit - all files are "changed"
-            for item in commit.tree.traverse():
-                if (
-                    hasattr(item, "type") and getattr(item, "type", None) == "blob"
-                ):  # It's a file
-                    item_path = getattr(item, "path", "")
-                    if item_path:
-                        files_changed.append(str(item_path))
-
-        commits.append(
-            GitCommit(
-                hash=commit.hexsha,
-                author=commit.author.name or "Unknown",
-                email=commit.author.email or "unknown@example.com",
-                date=datetime.fromtimestamp(commit.committed_date),
-                message=commit.message.strip()
-                if isinstance(commit.message, str)
-                else commit.message.decode().strip(),
-                files_changed=files_changed,
-                repo_name=repo_name,
-            )
-        )
-
-    return commits
+    return get_commits(
+        repo_path, since=f"{days} days ago", repo_name=repo_name, options=options
+    )
 
 
 def process_single_repository(
     repo_path: str,
+    repo_name: str,
     since: str | None = None,
     until: str | None = None,
     days: int | None = None,
     count: int | None = None,
+    options: CommitReadOptions = CommitReadOptions(),
 ) -> list[GitCommit]:
     """Process a single repository and return commits based on filters."""
     logger.debug(f"Processing repository: {repo_path}")
 
     # Parameter precedence: count > days > since/until > default
+    max_count = None
     if count is not None:
-        logger.debug(f"Getting last {count} commits from {Path(repo_path).name}")
-        return get_recent_commits_by_count(repo_path, count)
+        logger.debug(f"Getting last {count} commits from {repo_name}")
+        since, until, max_count = None, None, count
     elif days is not None:
-        logger.debug(
-            f"Getting commits from last {days} days from {Path(repo_path).name}"
-        )
-        return get_recent_commits(repo_path, days)
+        logger.debug(f"Getting commits from last {days} days from {repo_name}")
+        since, until = f"{days} days ago", None
     elif since or until:
-        logger.debug(f"Getting commits with date filters from {Path(repo_path).name}")
-        return get_commits(repo_path, since=since, until=until)
+        logger.debug(f"Getting commits with date filters from {repo_name}")
     else:
-        logger.debug(f"Getting commits from last 7 days from {Path(repo_path).name}")
-        return get_recent_commits(repo_path, 7)
+        logger.debug(f"Getting commits from last 7 days from {repo_name}")
+        since = "7 days ago"
+
+    # Materialize inside the worker thread so the git work runs concurrently.
+    return list(
+        get_commits(
+            repo_path,
+            since=since,
+            until=until,
+            max_count=max_count,
+            repo_name=repo_name,
+            options=options,
+        )
+    )
 
 
 def aggregate_commits_from_repos(
@@ -182,16 +565,47 @@ def aggregate_commits_from_repos(
     until: str | None = None,
     days: int | None = None,
     count: int | None = None,
+    repo_names: list[str] | None = None,
+    options: CommitReadOptions = CommitReadOptions(),
 ) -> list[GitCommit]:
-    """Aggregate commits from multiple repositories."""
-    all_commits: list[GitCommit] = []
+    """
+    Aggregate commits from multiple repositories.
+
+    repo_names, if given, are the display names matching repo_paths (as already
+    computed by the caller); otherwise they are derived from the paths. Every
+    repository is read with the same options; one whose `git log` fails or runs
+    past the timeout is skipped.
+    """
+    per_repo_commits: list[list[GitCommit]] = []
     repo_stats: list[str] = []
 
-    for repo_path in repo_paths:
+    if not repo_paths:
+        return []
+
+    if repo_names is None:
+        repo_names = [Path(repo_path).name for repo_path in repo_paths]
+
+    # Each repository is read by its own `git log` subprocess, so the work is
+    # I/O-bound and overlaps well across threads.
+    with ThreadPoolExecutor(max_workers=min(32, len(repo_paths))) as executor:
+        process = partial(
+            process_single_repository,
+            since=since,
+            until=until,
+            days=days,
+            count=count,
+            options=options,
+        )
+        futures = [
+            executor.submit(process, repo_path, repo_name)
+            for repo_path, repo_name in zip(repo_paths, repo_names)
+        ]
+
+    # Results are collected in input order to keep the statistics deterministic.
+    for repo_path, repo_name, future in zip(repo_paths, repo_names, futures):
         try:
-            commits = process_single_repository(repo_path, since, until, days, count)
-            all_commits.extend(commits)
-            repo_name = Path(repo_path).name
+            commits = future.result()
+            per_repo_commits.append(commits)
             repo_stats.append(f"{repo_name}: {len(commits)} commits")
         except Exception as e:
             logger.error(f"Failed to process repository '{repo_path}': {str(e)}")
@@ -200,14 +614,21 @@ def aggregate_commits_from_repos(
     if repo_stats:
         logger.info(f"Repository statistics: {', '.join(repo_stats)}")
 
-    # Sort by date (newest first) for chronological consistency
-    all_commits.sort(key=lambda c: c.date, reverse=True)
-
-    return all_commits
+    # git log already returns each repository's commits newest first, so a
+    # single repository needs no reordering, and a k-way merge keeps several in
+    # chronological order without a full sort.
+    if len(per_repo_commits) == 1:
+        return per_repo_commits[0]
+    merged = heapq.merge(
+        *per_repo_commits, key=attrgetter("committed_at"), reverse=True
+    )
+    # With a count, each repository contributed its last `count` commits, but only
+    # the newest `count` overall are kept; the rest of the merge is never run.
+    return list(merged if count is None else islice(merged, count))
 
 
 def filter_commits_by_authors(
-    commits: list[GitCommit], author_filters: list[str]
+    commits: Iterable[GitCommit], author_filters: list[str]
 ) -> tuple[list[GitCommit], dict[str, list[str]]]:
     """
     Filter commits by author names using partial matching.
@@ -216,25 +637,48 @@ def filter_commits_by_authors(
         tuple[filtered_commits, {filter: [matched_authors]}]
     """
     if not author_filters:
-        return commits, {}
-
-    # Convert filters to lowercase for case-insensitive matching
-    filters_lower = [f.lower() for f in author_filters]
+        return list(commits), {}
+
+    # One compiled pattern matches all filters in a single C-level call. Each
+    # alternative is an anchored lookahead, so the first filter (in the order
+    # given) that occurs anywhere in the author info wins, and its named group
+    # tells us which one it was.
+    pattern = re.compile(
+        "^(?:"
+        + "|".join(
+            f"(?=.*?(?P<f{i}>{re.escape(f.lower())}))"
+            for i, f in enumerate(author_filters)
+        )
+        + ")",
+        re.DOTALL,
+    )
 
     filtered_commits: list[GitCommit] = []
     matches_per_filter: dict[str, set[str]] = {f: set() for f in author_filters}
 
+    # Authors repeat across commits, so the pattern is run once per unique author
+    # and the matching filter (or None) is reused for the rest of their commits.
+    filter_by_author: dict[str, str | None] = {}
+
     for commit in commits:
-        author_info = f"{commit.author} <{commit.email}>".lower()
-
-        # Check if any filter matches this commit's author info
-        for original_filter, filter_lower in zip(author_filters, filters_lower):
-            if filter_lower in author_info:
-                filtered_commits.append(commit)
-                matches_per_filter[original_filter].add(
-                    f"{commit.author} <{commit.email}>"
-                )
-                break  # Don't duplicate commits if multiple filters match
+        author_key_lower = commit.author_key_lower
+        if author_key_lower in filter_by_author:
+            original_filter = filter_by_author[author_key_lower]
+        else:
+            match = pattern.match(author_key_lower)
+            original_filter = (
+                author_filters[int(match.lastgroup[1:])]
+                if match is not None and match.lastgroup is not None
+                else None
+            )
+            filter_by_author[author_key_lower] = original_filter
+
+        if original_filter is None:
+            continue
+
+        # Don't duplicate commits if multiple filters match
+        filtered_commits.append(commit)
+        matches_per_filter[original_filter].add(commit.author_key)
 
     # Convert sets to lists for return value
     matches_dict = {f: list(matches) for f, matches in matches_per_filter.items()}
@@ -242,10 +686,9 @@ def filter_commits_by_authors(
     return filtered_commits, matches_dict
 
 
-def group_commits_by_author(commits: list[GitCommit]) -> dict[str, list[GitCommit]]:
+def group_commits_by_author(commits: Iterable[GitCommit]) -> dict[str, list[GitCommit]]:
     """Group commits by author email."""
-    author_commits: dict[str, list[GitCommit]] = defaultdict(list)
+    author_commits: dict[str, list[GitCommit]] = {}
     for commit in commits:
-        author_key = f"{commit.author} <{commit.email}>"
-        author_commits[author_key].append(commit)
-    return dict(author_commits)
+        author_commits.setdefault(commit.author_key, []).append(commit)
+    return author_commits
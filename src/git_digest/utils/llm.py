@@ -1,20 +1,59 @@
+import asyncio
+import json
 import logging
 import os
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from functools import cache
+from typing import TYPE_CHECKING
 
 import typer
-from openai import OpenAI
 
 from git_digest.const import PROVIDERS
 from git_digest.types import Provider
+from git_digest.utils.cache import get_llm_cache, make_cache_key
 from git_digest.utils.git import GitCommit
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
+# Default maximum number of LLM requests in flight at once, to stay within
+# provider rate limits when summarizing many authors or chunks.
+MAX_CONCURRENT_REQUESTS = 8
 
-def get_llm_client(provider: Provider) -> tuple[OpenAI, str]:
-    """Initialize LLM client using OpenAI SDK for the specified provider."""
-    config = PROVIDERS[provider]
-    api_key_env = config["api_key_env"]
+# Maximum number of authors packed into a single LLM request in --by-author mode
+# (fewer if their commits do not fit in the context window), which also bounds
+# the size of the JSON reply.
+AUTHORS_PER_REQUEST = 5
+
+# Separator between formatted commits in the text sent to the LLM.
+COMMIT_SEPARATOR = "\n---\n"
+
+# Rough number of characters per token, used to estimate prompt sizes without
+# depending on a provider-specific tokenizer. Commit text is mostly hashes, paths
+# and emails, which tokenize worse than prose, so the estimate is conservative.
+CHARS_PER_TOKEN = 3
+
+# Share of the context window that commits (or partial summaries) may fill in a
+# single request. The rest is left for the instructions and the reply (which some
+# providers count against the same window) and absorbs errors in the estimate.
+PROMPT_WINDOW_FRACTION = 0.6
+
+# Streamed replies are handed to the caller at most this often (in seconds), so
+# the terminal is written in a few larger chunks rather than once per token.
+STREAM_FLUSH_INTERVAL = 0.05
+
+
+def validate_provider_credentials(provider: Provider) -> str:
+    """
+    Check that the API key for the provider is set, and return it.
+
+    Raises:
+        typer.Exit: If the provider's API key environment variable is not set
+    """
+    api_key_env = PROVIDERS[provider]["api_key_env"]
 
     api_key = os.getenv(api_key_env)
     if not api_key:
@@ -24,143 +63,625 @@ def get_llm_client(provider: Provider) -> tuple[OpenAI, str]:
         )
         raise typer.Exit(1)
 
+    return api_key
+
+
+@cache
+def get_llm_client(provider: Provider) -> tuple["AsyncOpenAI", str]:
+    """
+    Initialize LLM client using OpenAI SDK for the specified provider.
+
+    The client is created once per provider; later calls return the same one.
+    """
+    config = PROVIDERS[provider]
+    api_key = validate_provider_credentials(provider)
+
+    # The OpenAI SDK is slow to import, so it is only loaded once a summary is
+    # actually requested (not for --help or argument/validation failures).
+    from openai import AsyncOpenAI
+
     logger.debug(f"Initializing {provider} client with OpenAI SDK")
-    client = OpenAI(base_url=config["base_url"], api_key=api_key)
+    client = AsyncOpenAI(base_url=config["base_url"], api_key=api_key)
     model = config["default_model"]
 
     return client, model
 
 
-def format_commits_for_llm(commits: list[GitCommit]) -> str:
-    """Format git commits for LLM processing."""
-    if not commits:
-        return "No commits found in the specified date range."
+class _StreamCoalescer:
+    """Forward streamed text in batches, trimming it like `str.strip()` would."""
+
+    def __init__(self, on_text: Callable[[str], None]) -> None:
+        self.on_text = on_text
+        self.pending = ""
+        self.started = False
+        self.last_flush = time.monotonic()
+
+    def add(self, delta: str) -> None:
+        self.pending += delta
+        if time.monotonic() - self.last_flush >= STREAM_FLUSH_INTERVAL:
+            self.flush()
 
-    formatted: list[str] = []
-    for commit in commits:
-        files_str = (
-            ", ".join(commit.files_changed)
-            if commit.files_changed
-            else "No files changed"
+    def flush(self) -> None:
+        # Leading whitespace of the reply is dropped, and trailing whitespace is
+        # held back until more text follows it (it is dropped at the very end).
+        text = self.pending if self.started else self.pending.lstrip()
+        body = text.rstrip()
+        if body:
+            self.on_text(body)
+            self.started = True
+        self.pending = text[len(body) :]
+        self.last_flush = time.monotonic()
+
+
+def _is_json_object(text: str) -> bool:
+    """Return whether text parses as a JSON object."""
+    try:
+        return isinstance(json.loads(text), dict)
+    except ValueError:
+        return False
+
+
+async def complete(
+    client: "AsyncOpenAI",
+    model: str,
+    prompt: str,
+    use_cache: bool = True,
+    json_mode: bool = False,
+    on_text: Callable[[str], None] | None = None,
+) -> str:
+    """
+    Send a single-message prompt and return the stripped reply text.
+
+    Replies are cached on disk by (model, prompt), so repeated runs over the same
+    commits skip the API call entirely. With json_mode, the provider is asked to
+    reply with a JSON object (providers without support simply ignore it), and
+    only a reply that parses as one is cached. With on_text, the reply is
+    streamed and passed to on_text piece by piece as it arrives (a cached reply
+    is passed in one piece). Empty replies are never cached.
+    """
+    cache_key = make_cache_key(
+        model=model, prompt=prompt, format="json" if json_mode else "text"
+    )
+    if use_cache:
+        cached = get_llm_cache().get(cache_key)
+        # Entries stored before JSON replies were validated may not parse.
+        if cached is not None and (not json_mode or _is_json_object(cached)):
+            logger.debug(f"Using cached response for prompt {cache_key[:12]}")
+            if on_text and cached:
+                on_text(cached)
+            return cached
+
+    if on_text:
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True,
         )
-        formatted.append(
-            f"Commit: {commit.hash[:8]} ({commit.repo_name})\n"
-            f"Author: {commit.author} <{commit.email}>\n"
-            f"Date: {commit.date.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            f"Message: {commit.message}\n"
-            f"Files: {files_str}\n"
+        coalescer = _StreamCoalescer(on_text)
+        parts: list[str] = []
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                coalescer.add(delta)
+        coalescer.flush()
+        reply = "".join(parts).strip()
+    else:
+        from openai import NOT_GIVEN
+
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"} if json_mode else NOT_GIVEN,
         )
+        content = response.choices[0].message.content
+        reply = content.strip() if content else ""
 
-    return "\n---\n".join(formatted)
+    # An empty reply, or a JSON-mode reply that is not a JSON object, is never
+    # cached, so the next run asks the model again.
+    if use_cache and reply and (not json_mode or _is_json_object(reply)):
+        get_llm_cache().set(cache_key, reply)
+    return reply
 
 
-def summarize(commits_text: str, provider: Provider, repo_names: list[str]) -> str:
-    """Use LLM to summarize git commits from multiple repositories."""
-    client, model = get_llm_client(provider)
+def format_commit(commit: GitCommit) -> str:
+    """Format a single git commit for LLM processing."""
+    return (
+        f"Commit: {commit.hash[:8]} ({commit.repo_name})\n"
+        f"Author: {commit.author_key}\n"
+        f"Date: {commit.date_str}\n"
+        f"Message: {commit.message}\n"
+        f"Files: {', '.join(commit.files_changed) or 'No files changed'}\n"
+    )
+
+
+def format_commits_for_llm(commits: Iterable[GitCommit]) -> str:
+    """
+    Format git commits for LLM processing.
+
+    commits may be any iterable (e.g. a generator from `get_commits`); it is
+    consumed once, without building an intermediate list of commits.
+    """
+    return (
+        COMMIT_SEPARATOR.join(map(format_commit, commits))
+        or "No commits found in the specified date range."
+    )
 
-    if len(repo_names) > 1:
-        repo_context = f"from {len(repo_names)} repositories: {', '.join(repo_names)}"
-        multi_repo_instruction = """
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the number of tokens in text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def prompt_token_budget(provider: Provider) -> int:
+    """Return the estimated tokens of commits or summaries one request may hold."""
+    return int(PROVIDERS[provider]["context_window"] * PROMPT_WINDOW_FRACTION)
+
+
+def pack_texts(texts: Iterable[str], max_tokens: int) -> list[list[str]]:
+    """
+    Pack texts, in order, into groups of at most max_tokens.
+
+    A single text larger than max_tokens gets a group of its own.
+    """
+    groups: list[list[str]] = [[]]
+    group_tokens = 0
+    for text in texts:
+        tokens = estimate_tokens(text)
+        if groups[-1] and group_tokens + tokens > max_tokens:
+            groups.append([])
+            group_tokens = 0
+        groups[-1].append(text)
+        group_tokens += tokens
+    return groups
+
+
+def chunk_commits_text(commits: Iterable[GitCommit], max_tokens: int) -> list[str]:
+    """
+    Format commits and pack them, in order, into chunks of at most max_tokens.
+
+    A single commit larger than max_tokens gets a chunk of its own.
+
+    Returns:
+        The formatted text of each chunk
+    """
+    return [
+        COMMIT_SEPARATOR.join(chunk)
+        for chunk in pack_texts(map(format_commit, commits), max_tokens)
+    ]
+
+
+def _join_partial_summaries(summaries: list[str]) -> str:
+    """Number and join partial summaries for a combining prompt."""
+    return "\n\n".join(
+        f"Part {index}:\n{summary}" for index, summary in enumerate(summaries, start=1)
+    )
+
+
+async def reduce_summaries(
+    summaries: list[str],
+    max_tokens: int,
+    combine: Callable[[str], Awaitable[str]],
+) -> str:
+    """
+    Merge partial summaries until they fit in max_tokens together.
+
+    While they do not fit, consecutive summaries that do are joined and passed to
+    combine (concurrently), which returns their merged summary, and the merged
+    summaries are reduced again.
+
+    Returns:
+        The joined text of the remaining summaries, for the final combining prompt
+    """
+    groups = pack_texts(summaries, max_tokens)
+    # A group of one cannot be merged further, so a summary too large on its own
+    # is passed through rather than looping forever.
+    while len(groups) > 1 and any(len(group) > 1 for group in groups):
+        logger.debug(f"Merging {len(summaries)} partial summaries in {len(groups)}")
+        merged = iter(
+            await asyncio.gather(
+                *(
+                    combine(_join_partial_summaries(group))
+                    for group in groups
+                    if len(group) > 1
+                )
+            )
+        )
+        summaries = [next(merged) if len(group) > 1 else group[0] for group in groups]
+        groups = pack_texts(summaries, max_tokens)
+    return _join_partial_summaries(summaries)
+
+
+# Static parts of the prompts, built once instead of on every request.
+_SUMMARY_FOCUS = """- Key changes, features added, and bugs fixed
+- Overall development progress and milestones
+- Important architectural or design decisions"""
+
+_MULTI_REPO_INSTRUCTION = """
 
 Look for related work across repositories and identify:
 1. Major features or initiatives that span multiple repositories
 2. Coordinated changes and how they work together
 3. Cross-repository dependencies and integration work
 4. Overall development themes and architectural decisions"""
+
+_AUTHOR_FOCUS = """Focus on the key changes, features, and improvements they implemented.
+Be specific about what they accomplished and the impact of their work."""
+
+_AUTHOR_MULTI_REPO_INSTRUCTION = """Look for related work across repositories and explain how their changes work together.
+Identify cross-repository coordination and the bigger picture of their contributions."""
+
+_AUTHOR_BATCH_INSTRUCTIONS = """For each author, focus on the key changes, features, and improvements they implemented.
+Be specific about what they accomplished and the impact of their work.
+When an author worked across several repositories, explain how their changes work together.
+
+Respond with a JSON object of the form {"summaries": [{"author": "<author>", "summary": "<summary>"}]},
+with one entry per author, using each author exactly as written in the headings below."""
+
+
+def _repo_prompt_parts(repo_names: list[str]) -> tuple[str, str]:
+    """Return the repository context and extra instructions for summary prompts."""
+    if len(repo_names) > 1:
+        repo_context = f"from {len(repo_names)} repositories: {', '.join(repo_names)}"
+        multi_repo_instruction = _MULTI_REPO_INSTRUCTION
     else:
         repo_context = f"from repository: {repo_names[0]}"
         multi_repo_instruction = ""
+    return repo_context, multi_repo_instruction
+
+
+async def summarize(
+    client: "AsyncOpenAI",
+    model: str,
+    commits: list[GitCommit],
+    provider: Provider,
+    repo_names: list[str],
+    use_cache: bool = True,
+    on_text: Callable[[str], None] | None = None,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+) -> str:
+    """
+    Use LLM to summarize git commits from multiple repositories.
+
+    Commits that do not fit in the model's context window are split into chunks
+    that are summarized concurrently, and the partial summaries are then merged
+    into one (map-reduce). If on_text is given, the final summary is streamed to
+    it as it is generated. At most max_concurrency chunks are summarized at once.
+    """
+    repo_context, multi_repo_instruction = _repo_prompt_parts(repo_names)
 
-    prompt = f"""Analyze the following git commits {repo_context}.
+    max_tokens = prompt_token_budget(provider)
+    chunks = chunk_commits_text(commits, max_tokens) if commits else []
+
+    def combine_prompt(summaries_text: str) -> str:
+        return f"""The following are summaries of consecutive parts of the git commits {repo_context}, newest first.
+
+Combine them into a single clear, human-readable development summary that focuses on:
+{_SUMMARY_FOCUS}{multi_repo_instruction}
+
+Partial summaries:
+{summaries_text}
+
+Summary:"""
+
+    try:
+        if len(chunks) <= 1:
+            commits_text = chunks[0] if chunks else format_commits_for_llm(commits)
+            prompt = f"""Analyze the following git commits {repo_context}.
 
 Provide a clear, human-readable development summary that focuses on:
-- Key changes, features added, and bugs fixed
-- Overall development progress and milestones
-- Important architectural or design decisions{multi_repo_instruction}
+{_SUMMARY_FOCUS}{multi_repo_instruction}
 
 Git commits:
 {commits_text}
 
 Summary:"""
+            return await complete(client, model, prompt, use_cache, on_text=on_text)
 
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
+        logger.info(
+            f"Commits exceed the {model} context window, "
+            f"summarizing them in {len(chunks)} parts"
         )
 
-        content = response.choices[0].message.content
-        return content.strip() if content else ""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def summarize_chunk(index: int, commits_text: str) -> str:
+            prompt = f"""Analyze the following git commits {repo_context}.
+They are part {index} of {len(chunks)} of the commits in the period being summarized.
+
+Provide a clear, human-readable development summary that focuses on:
+{_SUMMARY_FOCUS}
+
+Git commits:
+{commits_text}
+
+Summary:"""
+            async with semaphore:
+                return await complete(client, model, prompt, use_cache)
+
+        async def combine(summaries_text: str) -> str:
+            async with semaphore:
+                return await complete(
+                    client, model, combine_prompt(summaries_text), use_cache
+                )
+
+        partial_summaries = await asyncio.gather(
+            *(
+                summarize_chunk(index, commits_text)
+                for index, commits_text in enumerate(chunks, start=1)
+            )
+        )
+        summaries_text = await reduce_summaries(
+            list(partial_summaries), max_tokens, combine
+        )
+        return await complete(
+            client, model, combine_prompt(summaries_text), use_cache, on_text=on_text
+        )
 
     except Exception as e:
         logger.error(f"Error calling {provider} API: {str(e)}")
         raise typer.Exit(1)
 
 
-def summarize_by_author(
-    author_commits: dict[str, list[GitCommit]], provider: Provider
-) -> str:
-    """Generate author-specific summaries using LLM."""
-    client, model = get_llm_client(provider)
+def format_author_section(author: str, commits: list[GitCommit], summary: str) -> str:
+    """Format one author's summary as a Markdown section."""
+    commit_count = len(commits)
+    commit_word = "commit" if commit_count == 1 else "commits"
+    return f"## {author} ({commit_count} {commit_word})\n\n{summary}"
 
-    summaries: list[str] = []
 
-    # Collect repository info for context (not used in current implementation)
-    all_repos: set[str] = set()
-    for commits in author_commits.values():
-        for commit in commits:
-            if commit.repo_name:
-                all_repos.add(commit.repo_name)
+async def summarize_author(
+    client: "AsyncOpenAI",
+    model: str,
+    author: str,
+    commits: list[GitCommit],
+    provider: Provider,
+    semaphore: asyncio.Semaphore,
+    use_cache: bool = True,
+) -> str:
+    """
+    Generate the summary section for a single author.
 
-    for author, commits in author_commits.items():
-        logger.debug(f"Generating summary for {author} ({len(commits)} commits)")
+    Like `summarize`, an author whose commits do not fit in the model's context
+    window is summarized in chunks whose summaries are then merged.
+    """
+    logger.debug(f"Generating summary for {author} ({len(commits)} commits)")
 
-        commits_text = format_commits_for_llm(commits)
+    max_tokens = prompt_token_budget(provider)
+    chunks = chunk_commits_text(commits, max_tokens) if commits else []
 
-        # Count repositories this author worked in
-        author_repos = set(commit.repo_name for commit in commits if commit.repo_name)
-        repo_count = len(author_repos)
+    # Count repositories this author worked in
+    author_repos = set(commit.repo_name for commit in commits if commit.repo_name)
+    repo_count = len(author_repos)
 
-        if repo_count > 1:
-            multi_repo_context = f"""
+    if repo_count > 1:
+        multi_repo_context = f"""
 This author worked across {repo_count} repositories: {", ".join(sorted(author_repos))}.
-Look for related work across repositories and explain how their changes work together.
-Identify cross-repository coordination and the bigger picture of their contributions."""
-        else:
-            multi_repo_context = ""
+{_AUTHOR_MULTI_REPO_INSTRUCTION}"""
+    else:
+        multi_repo_context = ""
 
+    async def summarize_chunk(index: int, commits_text: str) -> str:
         prompt = f"""Provide a comprehensive summary of contributions made by {author}.
+These are part {index} of {len(chunks)} of their commits in the period being summarized.
 
-Focus on the key changes, features, and improvements they implemented.
-Be specific about what they accomplished and the impact of their work.{multi_repo_context}
+{_AUTHOR_FOCUS}
 
 Commits by {author}:
 {commits_text}
 
+Summary for {author}:"""
+        async with semaphore:
+            return await complete(client, model, prompt, use_cache)
+
+    def combine_prompt(summaries_text: str) -> str:
+        return f"""The following are summaries of consecutive parts of the commits by {author}, newest first.
+Combine them into a single comprehensive summary of their contributions.
+
+{_AUTHOR_FOCUS}{multi_repo_context}
+
+Partial summaries:
+{summaries_text}
+
 Summary for {author}:"""
 
-        try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
+    async def combine(summaries_text: str) -> str:
+        async with semaphore:
+            return await complete(
+                client, model, combine_prompt(summaries_text), use_cache
             )
 
-            content = response.choices[0].message.content
-            author_summary = content.strip() if content else ""
+    try:
+        if len(chunks) <= 1:
+            commits_text = chunks[0] if chunks else format_commits_for_llm(commits)
+            prompt = f"""Provide a comprehensive summary of contributions made by {author}.
+
+{_AUTHOR_FOCUS}{multi_repo_context}
 
-            commit_count = len(commits)
-            commit_word = "commit" if commit_count == 1 else "commits"
+Commits by {author}:
+{commits_text}
 
-            summaries.append(
-                f"## {author} ({commit_count} {commit_word})\n\n{author_summary}"
+Summary for {author}:"""
+        else:
+            logger.debug(f"Summarizing {author} in {len(chunks)} parts")
+            partial_summaries = await asyncio.gather(
+                *(
+                    summarize_chunk(index, commits_text)
+                    for index, commits_text in enumerate(chunks, start=1)
+                )
+            )
+            summaries_text = await reduce_summaries(
+                list(partial_summaries), max_tokens, combine
             )
+            prompt = combine_prompt(summaries_text)
+
+        async with semaphore:
+            author_summary = await complete(client, model, prompt, use_cache)
+
+        return format_author_section(author, commits, author_summary)
 
-        except Exception as e:
-            logger.error(
-                f"Error generating summary for {author} using {provider}: {str(e)}"
+    except Exception as e:
+        logger.error(
+            f"Error generating summary for {author} using {provider}: {str(e)}"
+        )
+        return f"## {author} ({len(commits)} commits)\n\nError generating summary for this author."
+
+
+def parse_batch_summaries(reply: str) -> dict[str, str]:
+    """Parse a batched `{"summaries": [{"author", "summary"}]}` reply."""
+    data = json.loads(reply)
+    summaries: dict[str, str] = {}
+    for entry in data.get("summaries", []):
+        author, summary = entry.get("author"), entry.get("summary")
+        if isinstance(author, str) and isinstance(summary, str):
+            summaries[author] = summary.strip()
+    return summaries
+
+
+async def summarize_author_batch(
+    client: "AsyncOpenAI",
+    model: str,
+    batch: list[tuple[str, list[GitCommit]]],
+    provider: Provider,
+    semaphore: asyncio.Semaphore,
+    use_cache: bool = True,
+) -> list[str]:
+    """
+    Generate summary sections for several authors with a single LLM request.
+
+    The model is asked for a JSON object with one summary per author. Authors
+    missing from the reply (or all of them, if the reply cannot be parsed) are
+    summarized individually instead.
+    """
+    if len(batch) == 1:
+        author, commits = batch[0]
+        return [
+            await summarize_author(
+                client, model, author, commits, provider, semaphore, use_cache
             )
-            summaries.append(
-                f"## {author} ({len(commits)} commits)\n\nError generating summary for this author."
+        ]
+
+    logger.debug(f"Generating summaries for {len(batch)} authors in one request")
+
+    author_blocks: list[str] = []
+    for author, commits in batch:
+        author_repos = sorted(
+            {commit.repo_name for commit in commits if commit.repo_name}
+        )
+        repo_line = (
+            f"Repositories: {', '.join(author_repos)}\n"
+            if len(author_repos) > 1
+            else ""
+        )
+        author_blocks.append(
+            f"### {author}\n{repo_line}{format_commits_for_llm(commits)}"
+        )
+    authors_text = "\n\n".join(author_blocks)
+
+    prompt = f"""Provide a comprehensive summary of contributions made by each of the {len(batch)} authors below.
+
+{_AUTHOR_BATCH_INSTRUCTIONS}
+
+{authors_text}"""
+
+    try:
+        async with semaphore:
+            reply = await complete(client, model, prompt, use_cache, json_mode=True)
+        summaries = parse_batch_summaries(reply)
+    except Exception as e:
+        logger.warning(
+            f"Batched summary for {len(batch)} authors using {provider} failed, "
+            f"summarizing them individually: {str(e)}"
+        )
+        summaries = {}
+
+    missing = [
+        (author, commits) for author, commits in batch if author not in summaries
+    ]
+    if missing:
+        logger.debug(f"Summarizing {len(missing)} authors individually")
+    fallback_sections = iter(
+        await asyncio.gather(
+            *(
+                summarize_author(
+                    client, model, author, commits, provider, semaphore, use_cache
+                )
+                for author, commits in missing
             )
+        )
+    )
+
+    return [
+        format_author_section(author, commits, summaries[author])
+        if author in summaries
+        else next(fallback_sections)
+        for author, commits in batch
+    ]
+
+
+def batch_authors(
+    author_commits: dict[str, list[GitCommit]], max_tokens: int
+) -> list[list[tuple[str, list[GitCommit]]]]:
+    """
+    Pack authors, in order, into batches for summarize_author_batch.
+
+    A batch holds up to AUTHORS_PER_REQUEST authors whose formatted commits fit
+    in max_tokens together. An author too large for that gets a batch of their
+    own.
+    """
+    batches: list[list[tuple[str, list[GitCommit]]]] = []
+    batch_tokens = 0
+    for author, commits in author_commits.items():
+        tokens = estimate_tokens(format_commits_for_llm(commits))
+        if (
+            not batches
+            or len(batches[-1]) == AUTHORS_PER_REQUEST
+            or batch_tokens + tokens > max_tokens
+        ):
+            batches.append([])
+            batch_tokens = 0
+        batches[-1].append((author, commits))
+        batch_tokens += tokens
+    return batches
+
+
+async def summarize_by_author(
+    client: "AsyncOpenAI",
+    model: str,
+    author_commits: dict[str, list[GitCommit]],
+    provider: Provider,
+    use_cache: bool = True,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    on_text: Callable[[str], None] | None = None,
+) -> str:
+    """
+    Generate author-specific summaries using LLM.
+
+    At most max_concurrency requests are in flight at once. If on_text is given,
+    the summary is passed to it as it is generated, one batch of author sections
+    at a time and in author order.
+    """
+    # Authors are packed into as few requests as fit the context window, so the
+    # shared instructions are sent once per batch instead of once per author.
+    # Batches run concurrently, bounded by the semaphore, and are awaited in the
+    # original author order, so each one is emitted as soon as all earlier ones
+    # are done.
+    max_tokens = prompt_token_budget(provider)
+    batches = batch_authors(author_commits, max_tokens)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    tasks = [
+        asyncio.create_task(
+            summarize_author_batch(client, model, batch, provider, semaphore, use_cache)
+        )
+        for batch in batches
+    ]
+
+    sections: list[str] = []
+    for task in tasks:
+        batch_sections = await task
+        if on_text:
+            on_text(("\n\n" if sections else "") + "\n\n".join(batch_sections))
+        sections.extend(batch_sections)
 
-    return "\n\n".join(summaries)
+    return "\n\n".join(sections)
@@ -0,0 +1,80 @@
+import subprocess
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from git_digest.utils import cache
+
+
+def git(repo: Path, *args: str) -> str:
+    """Run git in repo and return its output."""
+    return subprocess.run(
+        ["git", "-C", str(repo), *args], check=True, capture_output=True, text=True
+    ).stdout
+
+
+class RepoBuilder:
+    """Builds a git history with one commit per call, a minute apart."""
+
+    def __init__(self, path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.path = path
+        self.monkeypatch = monkeypatch
+        self.commits = 0
+        git(path, "init", "--quiet", "--initial-branch=main")
+
+    def write(self, name: str, content: str = "content\n") -> None:
+        (self.path / name).write_text(content)
+
+    def _next_date(self) -> None:
+        self.commits += 1
+        date = f"2024-01-01T12:{self.commits:02d}:00+00:00"
+        self.monkeypatch.setenv("GIT_AUTHOR_DATE", date)
+        self.monkeypatch.setenv("GIT_COMMITTER_DATE", date)
+
+    def commit(self, message: str) -> None:
+        """Stage everything and commit it."""
+        self._next_date()
+        git(self.path, "add", "--all")
+        git(self.path, "commit", "--quiet", "--allow-empty", "-m", message)
+
+    def merge(self, branch: str, message: str) -> None:
+        """Merge branch into the current branch with a merge commit."""
+        self._next_date()
+        git(self.path, "merge", "--quiet", "--no-ff", "-m", message, branch)
+
+
+@pytest.fixture(autouse=True)
+def isolated_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    """Keep git config and the on-disk caches of the user out of the tests."""
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "Ada Lovelace")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "ada@example.com")
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "Ada Lovelace")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "ada@example.com")
+    monkeypatch.setenv("TZ", "UTC")
+
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    cache.get_llm_cache.cache_clear()
+    cache.get_commit_cache.cache_clear()
+    yield
+    cache.get_llm_cache.cache_clear()
+    cache.get_commit_cache.cache_clear()
+
+
+MakeRepo = Callable[..., RepoBuilder]
+
+
+@pytest.fixture
+def make_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> MakeRepo:
+    """Return a factory for empty repositories under tmp_path."""
+
+    def factory(name: str = "repo") -> RepoBuilder:
+        path = tmp_path / name
+        path.mkdir()
+        return RepoBuilder(path, monkeypatch)
+
+    return factory
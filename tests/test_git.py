@@ -0,0 +1,219 @@
+# pyright: reportPrivateUsage=false
+import re
+import subprocess
+
+import pytest
+from conftest import MakeRepo, RepoBuilder, git
+
+from git_digest.utils.git import (
+    _LOG_FORMAT,
+    COMMIT_DATE_FORMAT,
+    CommitReadOptions,
+    GitCommit,
+    _parse_log_stream,
+    aggregate_commits_from_repos,
+    compile_path_excludes,
+    get_commits,
+)
+
+
+@pytest.fixture
+def history(make_repo: MakeRepo) -> RepoBuilder:
+    """A repository with root, rename, merge and empty commits."""
+    repo = make_repo()
+    repo.write("a.txt")
+    repo.write("b.txt")
+    repo.commit("Initial commit")
+
+    git(repo.path, "mv", "a.txt", "c.txt")
+    repo.commit("Rename a to c")
+
+    git(repo.path, "checkout", "--quiet", "-b", "feature")
+    repo.write("feature.txt")
+    repo.commit("Add feature")
+    git(repo.path, "checkout", "--quiet", "main")
+    repo.write("main.txt")
+    repo.commit("Change main")
+    repo.merge("feature", "Merge feature")
+
+    repo.commit("Empty commit")
+    return repo
+
+
+def by_message(commits: list[GitCommit]) -> dict[str, GitCommit]:
+    return {commit.message: commit for commit in commits}
+
+
+def test_commits_are_newest_first(history: RepoBuilder):
+    commits = list(get_commits(str(history.path)))
+
+    assert [commit.message for commit in commits] == [
+        "Empty commit",
+        "Merge feature",
+        "Change main",
+        "Add feature",
+        "Rename a to c",
+        "Initial commit",
+    ]
+    assert commits[0].hash == git(history.path, "rev-parse", "HEAD").strip()
+    assert commits[0].author_key == "Ada Lovelace <ada@example.com>"
+    assert commits[0].repo_name == "repo"
+
+
+def test_changed_files(history: RepoBuilder):
+    commits = by_message(list(get_commits(str(history.path))))
+
+    # The root commit lists every file it adds, a rename both of its paths, a
+    # merge the changes against its first parent, and an empty commit nothing.
+    assert commits["Initial commit"].files_changed == ["a.txt", "b.txt"]
+    assert commits["Rename a to c"].files_changed == ["a.txt", "c.txt"]
+    assert commits["Merge feature"].files_changed == ["feature.txt"]
+    assert commits["Empty commit"].files_changed == []
+
+
+def test_max_count_and_dates(history: RepoBuilder):
+    commits = list(get_commits(str(history.path), max_count=2))
+
+    assert [commit.message for commit in commits] == ["Empty commit", "Merge feature"]
+    assert commits[0].date_str == "2024-01-01 12:06:00"
+    assert commits[0].committed_at == 1704110760
+
+
+def test_control_characters_in_messages_and_paths(make_repo: MakeRepo):
+    repo = make_repo()
+    repo.write("f\x1eile")
+    repo.write("tab\tand\nnewline")
+    repo.write("plain")
+    repo.commit("Record \x1e and unit \x1f separators\n\nBody")
+    repo.write("plain", "changed\n")
+    repo.commit("Second")
+
+    commits = list(get_commits(str(repo.path)))
+
+    assert [commit.message for commit in commits] == [
+        "Second",
+        "Record \x1e and unit \x1f separators\n\nBody",
+    ]
+    assert commits[1].files_changed == ["f\x1eile", "plain", "tab\tand\nnewline"]
+
+
+def test_exclude_and_message_length(make_repo: MakeRepo):
+    repo = make_repo()
+    repo.write("app.py")
+    repo.write("uv.lock")
+    repo.commit("A   long\n\nmessage that goes on")
+    options = CommitReadOptions(
+        exclude=compile_path_excludes(["*.lock"]), max_message_length=10
+    )
+
+    (commit,) = get_commits(str(repo.path), options=options)
+
+    assert commit.files_changed == ["app.py"]
+    assert commit.message == "A long mes... [truncated]"
+
+
+def test_cached_commits_match_uncached(history: RepoBuilder):
+    path = str(history.path)
+    cached = CommitReadOptions(use_cache=True)
+    uncached = list(get_commits(path))
+
+    assert list(get_commits(path, options=cached)) == uncached  # cache misses
+    assert list(get_commits(path, options=cached)) == uncached  # cache hits
+
+    # A new commit is read from git and the rest from the cache.
+    history.write("new.txt")
+    history.commit("New commit")
+    assert list(get_commits(path, options=cached)) == list(get_commits(path))
+
+
+def test_cached_commits_honour_options(make_repo: MakeRepo):
+    repo = make_repo()
+    repo.write("app.py")
+    repo.write("uv.lock")
+    repo.commit("Message")
+    path = str(repo.path)
+
+    (full,) = get_commits(path, options=CommitReadOptions(use_cache=True))
+    (excluded,) = get_commits(
+        path,
+        options=CommitReadOptions(
+            use_cache=True, exclude=compile_path_excludes(["*.lock"])
+        ),
+    )
+
+    assert full.files_changed == ["app.py", "uv.lock"]
+    assert excluded.files_changed == ["app.py"]
+
+
+def test_stream_parsing_across_chunk_boundaries(history: RepoBuilder):
+    output = subprocess.run(
+        [
+            "git",
+            "-C",
+            str(history.path),
+            "log",
+            _LOG_FORMAT,
+            f"--date=format-local:{COMMIT_DATE_FORMAT}",
+            "--name-only",
+            "-z",
+            "--root",
+            "--no-renames",
+            "--diff-merges=first-parent",
+        ],
+        check=True,
+        capture_output=True,
+    ).stdout
+
+    one_byte_chunks = (output[i : i + 1] for i in range(len(output)))
+
+    assert list(_parse_log_stream(one_byte_chunks, "repo")) == list(
+        get_commits(str(history.path))
+    )
+
+
+def test_malformed_record_is_skipped():
+    output = (
+        b"/\x00aaaa\x00Ada\x00ada@example.com\x00not-a-timestamp\x00date\x00Broken\x00"
+        b"\x00/\x00bbbb\x00Ada\x00ada@example.com\x001704110820\x00date\x00Fine\x00"
+        b"\nfile.txt\x00"
+    )
+
+    commits = list(_parse_log_stream([output], "repo"))
+
+    assert [(commit.hash, commit.files_changed) for commit in commits] == [
+        ("bbbb", ["file.txt"])
+    ]
+
+
+def test_failed_repository_is_skipped(history: RepoBuilder, make_repo: MakeRepo):
+    empty = make_repo("empty")
+
+    commits = aggregate_commits_from_repos(
+        [str(empty.path), str(history.path)], count=2
+    )
+
+    assert [commit.message for commit in commits] == ["Empty commit", "Merge feature"]
+
+
+def test_repositories_are_merged_newest_first(make_repo: MakeRepo):
+    first = make_repo("first")
+    second = make_repo("second")
+    first.commit("first 1")
+    second.commits = 1
+    second.commit("second 2")
+    first.commits = 2
+    first.commit("first 3")
+    second.commits = 3
+    second.commit("second 4")
+
+    commits = aggregate_commits_from_repos(
+        [str(first.path), str(second.path)], since="2000-01-01"
+    )
+
+    assert [(commit.repo_name, commit.message) for commit in commits] == [
+        ("second", "second 4"),
+        ("first", "first 3"),
+        ("second", "second 2"),
+        ("first", "first 1"),
+    ]
+    assert all(re.fullmatch(r"[0-9a-f]{40}", commit.hash) for commit in commits)
@@ -0,0 +1,240 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from git_digest.types import Provider
+from git_digest.utils import llm
+from git_digest.utils.git import GitCommit
+
+
+def make_commit(
+    author: str, message: str = "Change", repo_name: str = "repo"
+) -> GitCommit:
+    return GitCommit(
+        hash="0123456789abcdef",
+        author=author,
+        email=f"{author.lower()}@example.com",
+        committed_at=1704110400,
+        date_str="2024-01-01 12:00:00",
+        message=message,
+        files_changed=["file.txt"],
+        repo_name=repo_name,
+    )
+
+
+class FakeClient:
+    """Stands in for AsyncOpenAI, replying with the given texts in turn."""
+
+    def __init__(self, *replies: str) -> None:
+        self.replies = list(replies)
+        self.requests: list[dict[str, Any]] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **request: Any) -> Any:
+        self.requests.append(request)
+        message = SimpleNamespace(content=self.replies.pop(0))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeComplete:
+    """Replaces `llm.complete`, answering batched and single-author prompts."""
+
+    def __init__(self, batch_reply: str) -> None:
+        self.batch_reply = batch_reply
+        self.prompts: list[str] = []
+
+    async def __call__(
+        self,
+        client: Any,
+        model: str,
+        prompt: str,
+        use_cache: bool = True,
+        json_mode: bool = False,
+        on_text: Any = None,
+    ) -> str:
+        self.prompts.append(prompt)
+        return self.batch_reply if json_mode else "Individual summary"
+
+
+def run_batch(
+    monkeypatch: pytest.MonkeyPatch, batch_reply: str
+) -> tuple[list[str], list[str]]:
+    fake = FakeComplete(batch_reply)
+    client: Any = None
+    monkeypatch.setattr(llm, "complete", fake)
+    batch = [
+        ("Ada <ada@example.com>", [make_commit("Ada")]),
+        ("Bob <bob@example.com>", [make_commit("Bob"), make_commit("Bob")]),
+    ]
+    sections = asyncio.run(
+        llm.summarize_author_batch(
+            client,
+            "model",
+            batch,
+            Provider.OPENAI,
+            asyncio.Semaphore(2),
+        )
+    )
+    return sections, fake.prompts
+
+
+def test_parse_batch_summaries_skips_invalid_entries():
+    reply = json.dumps(
+        {
+            "summaries": [
+                {"author": "Ada", "summary": " Did things. "},
+                {"author": "Bob"},
+                {"author": 3, "summary": "Wrong type"},
+            ]
+        }
+    )
+
+    assert llm.parse_batch_summaries(reply) == {"Ada": "Did things."}
+
+
+def test_batch_reply_covers_every_author(monkeypatch: pytest.MonkeyPatch):
+    reply = json.dumps(
+        {
+            "summaries": [
+                {"author": "Bob <bob@example.com>", "summary": "Bob's work"},
+                {"author": "Ada <ada@example.com>", "summary": "Ada's work"},
+            ]
+        }
+    )
+
+    sections, prompts = run_batch(monkeypatch, reply)
+
+    assert len(prompts) == 1
+    assert sections == [
+        "## Ada <ada@example.com> (1 commit)\n\nAda's work",
+        "## Bob <bob@example.com> (2 commits)\n\nBob's work",
+    ]
+
+
+def test_batch_reply_missing_an_author(monkeypatch: pytest.MonkeyPatch):
+    reply = json.dumps(
+        {"summaries": [{"author": "Ada <ada@example.com>", "summary": "Ada's work"}]}
+    )
+
+    sections, prompts = run_batch(monkeypatch, reply)
+
+    assert len(prompts) == 2
+    assert "Commits by Bob <bob@example.com>" in prompts[1]
+    assert sections == [
+        "## Ada <ada@example.com> (1 commit)\n\nAda's work",
+        "## Bob <bob@example.com> (2 commits)\n\nIndividual summary",
+    ]
+
+
+@pytest.mark.parametrize("reply", ["not json", "[]", '{"summaries": 3}'])
+def test_malformed_batch_reply(monkeypatch: pytest.MonkeyPatch, reply: str):
+    sections, prompts = run_batch(monkeypatch, reply)
+
+    assert len(prompts) == 3
+    assert sections == [
+        "## Ada <ada@example.com> (1 commit)\n\nIndividual summary",
+        "## Bob <bob@example.com> (2 commits)\n\nIndividual summary",
+    ]
+
+
+def test_batch_authors_respects_size_and_count():
+    author_commits = {
+        f"Author {i}": [make_commit(f"Author{i}")]
+        for i in range(llm.AUTHORS_PER_REQUEST + 2)
+    }
+    author_commits["Big"] = [make_commit("Big", "x" * 3000)]
+
+    batches = llm.batch_authors(author_commits, max_tokens=500)
+
+    assert [[author for author, _ in batch] for batch in batches] == [
+        [f"Author {i}" for i in range(llm.AUTHORS_PER_REQUEST)],
+        ["Author 5", "Author 6"],
+        ["Big"],
+    ]
+
+
+def test_complete_caches_replies():
+    client: Any = FakeClient("A summary")
+
+    first = asyncio.run(llm.complete(client, "model", "prompt"))
+    second = asyncio.run(llm.complete(client, "model", "prompt"))
+
+    assert first == second == "A summary"
+    assert len(client.requests) == 1
+
+
+@pytest.mark.parametrize(
+    ("json_mode", "bad_reply"), [(False, "   "), (True, "not json")]
+)
+def test_complete_does_not_cache_unusable_replies(json_mode: bool, bad_reply: str):
+    fake = FakeClient(bad_reply, '{"summaries": []}')
+    client: Any = fake
+
+    asyncio.run(llm.complete(client, "model", "prompt", json_mode=json_mode))
+    reply = asyncio.run(llm.complete(client, "model", "prompt", json_mode=json_mode))
+
+    assert reply == '{"summaries": []}'
+    assert len(fake.requests) == 2
+
+
+def test_stream_coalescer_trims_like_strip(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(llm, "STREAM_FLUSH_INTERVAL", 0)
+    pieces: list[str] = []
+    coalescer = llm._StreamCoalescer(pieces.append)
+
+    for delta in ["\n  ", "Hello", " ", "\n", "world", "  ", "\n"]:
+        coalescer.add(delta)
+    coalescer.flush()
+
+    assert "".join(pieces) == "Hello \nworld"
+    assert all(piece == piece.rstrip() for piece in pieces)
+
+
+def test_stream_coalescer_batches_pieces(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(llm, "STREAM_FLUSH_INTERVAL", 3600)
+    pieces: list[str] = []
+    coalescer = llm._StreamCoalescer(pieces.append)
+
+    for delta in ["Hello", " ", "world"]:
+        coalescer.add(delta)
+    coalescer.flush()
+
+    assert pieces == ["Hello world"]
+
+
+def test_chunk_commits_text_keeps_order_and_size():
+    commits = [make_commit("Ada", f"Change {i}") for i in range(10)]
+    tokens = llm.estimate_tokens(llm.format_commit(commits[0]))
+
+    chunks = llm.chunk_commits_text(commits, max_tokens=3 * tokens)
+
+    assert len(chunks) == 4
+    assert llm.COMMIT_SEPARATOR.join(chunks) == llm.format_commits_for_llm(commits)
+
+
+def test_reduce_summaries_merges_until_they_fit():
+    combined: list[str] = []
+
+    async def combine(summaries_text: str) -> str:
+        combined.append(summaries_text)
+        return "m" * 30
+
+    summaries = ["s" * 90] * 8
+    text = asyncio.run(llm.reduce_summaries(summaries, 100, combine))
+
+    assert combined
+    assert all(llm.estimate_tokens(prompt) <= 110 for prompt in combined)
+    assert llm.estimate_tokens(text) <= 110
+
+
+def test_reduce_summaries_leaves_fitting_summaries_alone():
+    async def combine(summaries_text: str) -> str:
+        raise AssertionError("combine should not be called")
+
+    text = asyncio.run(llm.reduce_summaries(["one", "two"], 100, combine))
+
+    assert text == "Part 1:\none\n\nPart 2:\ntwo"